@@ -2,8 +2,8 @@
 LLM connector components for communicating with language model APIs.
 """
 
-from .connector_factory import create_connector
+from .connector_factory import close_connectors, create_connector
 from .github_connector import GitHubConnector
 from .response_handler import CodeValidationError, ResponseHandler
 
-__all__ = ["GitHubConnector", "create_connector", "ResponseHandler", "CodeValidationError"]
+__all__ = ["GitHubConnector", "create_connector", "close_connectors", "ResponseHandler", "CodeValidationError"]
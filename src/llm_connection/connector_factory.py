@@ -3,6 +3,7 @@ Factory for creating LLM connector instances.
 """
 
 import logging
+import threading
 
 from src.settings.settings_model import LlmSettings, SecretSettings
 
@@ -11,10 +12,21 @@ from .llm_connector import LLMConnector
 
 logger = logging.getLogger(__name__)
 
+# Connectors are reused across calls so each keeps its pooled HTTP connections.
+# Entries are keyed by id() and keep a reference to their settings and secrets,
+# so those ids cannot be reused by other objects while the entry exists.
+_connectors: dict[tuple[str, int, int], tuple[LlmSettings, SecretSettings, LLMConnector]] = {}
+# Serializes connector creation when experiments run on several threads
+_connectors_lock = threading.Lock()
+
 
 def create_connector(model_id: str, settings: LlmSettings, secrets: SecretSettings) -> LLMConnector:
     """
     Factory function to create an LLMConnector instance based on model_id and settings.
+
+    Connectors are cached per (model_id, settings, secrets), so repeated calls return the same instance.
+    Call close_connectors() to release them.
+
     Args:
         model_id: Identifier for the specific model to use
         settings: LlmSettings instance with configuration
@@ -22,16 +34,39 @@ def create_connector(model_id: str, settings: LlmSettings, secrets: SecretSettin
     Returns:
         An instance of LLMConnector for the specified model and provider
     """
+    cache_key = (model_id, id(settings), id(secrets))
+    entry = _connectors.get(cache_key)
+    if entry is not None:
+        logger.debug("Reusing connector for model: %s", model_id)
+        return entry[2]
+
+    with _connectors_lock:
+        # Another thread may have created it while we waited for the lock
+        entry = _connectors.get(cache_key)
+        if entry is None:
+            entry = (settings, secrets, _build_connector(model_id, settings, secrets))
+            _connectors[cache_key] = entry
+    return entry[2]
+
+
+def _build_connector(model_id: str, settings: LlmSettings, secrets: SecretSettings) -> LLMConnector:
+    """
+    Build a new connector for model_id from the settings.
+
+    Raises:
+        ValueError: If the model, its provider, or the provider type is unknown
+    """
+
     logger.info(f"Creating connector for model: {model_id}")
 
-    model_cfg = next((m for m in settings.models_settings if m.model_id == model_id), None)
+    model_cfg = settings.models_by_id.get(model_id)
     if model_cfg is None:
         logger.error(f"Model ID {model_id} not found in settings")
         raise ValueError(f"Model ID {model_id} not found in settings.")
 
     logger.debug(f"Model configuration found: provider={model_cfg.provider}")
 
-    provider_cfg = next((p for p in settings.providers if p.provider == model_cfg.provider), None)
+    provider_cfg = settings.providers_by_name.get(model_cfg.provider)
     if provider_cfg is None:
         logger.error(f"Provider {model_cfg.provider} for model {model_id} not found in settings")
         raise ValueError(f"Provider {model_cfg.provider} for model {model_id} not found in settings.")
@@ -40,7 +75,7 @@ def create_connector(model_id: str, settings: LlmSettings, secrets: SecretSettin
 
     if provider_cfg.provider == "github":
         logger.info(f"Initializing GitHub connector for model {model_id}")
-        return GitHubConnector(
+        connector = GitHubConnector(
             secret_settings=secrets,
             provider_settings=provider_cfg,
             model_settings=model_cfg,
@@ -49,3 +84,14 @@ def create_connector(model_id: str, settings: LlmSettings, secrets: SecretSettin
     else:
         logger.error(f"Unknown provider type: {provider_cfg.provider}")
         raise ValueError(f"Unknown provider type: {provider_cfg.provider}. Supported providers: github")
+
+    return connector
+
+
+def close_connectors() -> None:
+    """Close and forget all cached connectors."""
+    with _connectors_lock:
+        for _settings, _secrets, connector in _connectors.values():
+            connector.close()
+        _connectors.clear()
+    logger.debug("Closed all cached connectors")
@@ -2,7 +2,9 @@
 GitHub Models API connector implementation.
 """
 
+import asyncio
 import logging
+import math
 import threading
 import time
 
@@ -23,6 +25,11 @@ class GitHubConnector:
     _rate_limit_trackers: dict[str, float] = {}
     _rate_limit_lock = threading.Lock()
 
+    # Retry policy for batched queries
+    MAX_RETRIES = 3
+    RETRYABLE_STATUS_CODES = frozenset({429, 503})
+    MAX_RETRY_DELAY = 60.0
+
     def __init__(
         self,
         secret_settings: SecretSettings,
@@ -42,11 +49,19 @@ class GitHubConnector:
             "Content-Type": "application/json",
         }
 
+        # Generation parameters do not change for the lifetime of the connector
+        self._generation_params = self._resolve_generation_params()
+
+        # Reused across queries so connections to the provider are pooled and kept alive
+        self._client = httpx.Client(timeout=self.timeout_sec, headers=self.headers)
+        # Set by close(), so threads waiting for a rate limit slot stop instead of sleeping it out
+        self._closed = threading.Event()
+
         logger.info(f"GitHubConnector initialized for model: {model_settings.model_id}")
-        logger.debug(f"Provider URL: {provider_settings.url}")
-        logger.debug(f"Timeout: {timeout_sec} seconds")
+        logger.debug("Provider URL: %s", provider_settings.url)
+        logger.debug("Timeout: %s seconds", timeout_sec)
         if provider_settings.rate_limit_delay:
-            logger.debug(f"Rate limit delay: {provider_settings.rate_limit_delay} seconds")
+            logger.debug("Rate limit delay: %s seconds", provider_settings.rate_limit_delay)
 
     def query(self, prompt: RenderedPrompt, provider_id: str, model_id: str) -> LLMResponse:
         """
@@ -61,11 +76,149 @@ class GitHubConnector:
             LLMResponse with content and metadata
         """
         # Apply rate limiting if configured
-        self._apply_rate_limit()
+        delay = self._reserve_rate_limit_slot()
+        if delay > 0 and self._closed.wait(delay):
+            raise RuntimeError(f"Connector for model {self.model_name} was closed while waiting for a rate limit slot")
+
+        payload = self._build_payload(prompt, model_id)
+
+        try:
+            logger.debug("Making POST request to %s", self.provider_settings.url)
+            response = self._client.post(
+                url=str(self.provider_settings.url),  # Convert HttpUrl to string
+                json=payload,
+            )
+            response.raise_for_status()
+            logger.debug("Response received with status code: %s", response.status_code)
+
+            return self._handle_response(response, model_id, payload)
+
+        except Exception as e:
+            self._log_query_error(e)
+            raise
+
+    async def aquery(self, prompt: RenderedPrompt, provider_id: str, model_id: str) -> LLMResponse:
+        """
+        Asynchronous variant of query().
+
+        The async client is opened and closed within the call, so the connector can be
+        reused from any event loop. Use query_batch() to share connections across prompts.
+
+        Args:
+            prompt: The rendered prompt to send to the LLM
+            provider_id: Provider identifier (for logging)
+            model_id: Model identifier
+
+        Returns:
+            LLMResponse with content and metadata
+        """
+        async with self._new_async_client() as client:
+            try:
+                return await self._apost(client, prompt, model_id)
+            except Exception as e:
+                self._log_query_error(e)
+                raise
+
+    async def query_batch(self, prompts: list[RenderedPrompt], provider_id: str, model_id: str) -> list[LLMResponse | BaseException]:
+        """
+        Send several prompts concurrently, overlapping network latency.
+
+        At most provider_settings.max_concurrency requests are in flight at once, and
+        requests still honour the provider rate limit. Responses with a retryable status
+        (429, 503) are retried with exponential backoff, using the Retry-After header when present.
+
+        Args:
+            prompts: Rendered prompts to send to the LLM
+            provider_id: Provider identifier (for logging)
+            model_id: Model identifier
+
+        Returns:
+            List with one LLMResponse per prompt, in the same order as prompts.
+            Failed queries are returned as the raised exception instead of cancelling the batch.
+        """
+        semaphore = asyncio.Semaphore(self.provider_settings.max_concurrency)
+
+        async def _query_one(client: httpx.AsyncClient, prompt: RenderedPrompt) -> LLMResponse:
+            async with semaphore:
+                attempt = 0
+                while True:
+                    try:
+                        return await self._apost(client, prompt, model_id)
+                    except Exception as e:
+                        if isinstance(e, httpx.HTTPStatusError) and e.response.status_code in self.RETRYABLE_STATUS_CODES and attempt < self.MAX_RETRIES:
+                            # A retry may still succeed, so this is not an error yet
+                            delay = self._retry_delay(e.response, attempt)
+                            attempt += 1
+                            logger.warning("Received status %d, retrying in %.1f seconds (attempt %d/%d)", e.response.status_code, delay, attempt, self.MAX_RETRIES)
+                            await asyncio.sleep(delay)
+                            continue
+                        self._log_query_error(e)
+                        raise
+
+        logger.info("Sending %d queries to model: %s (max concurrency: %d)", len(prompts), model_id, self.provider_settings.max_concurrency)
+        # One client per batch: its pooled connections belong to the running event loop and are closed with it
+        async with self._new_async_client() as client:
+            return await asyncio.gather(*(_query_one(client, prompt) for prompt in prompts), return_exceptions=True)
+
+    @classmethod
+    def _retry_delay(cls, response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before retrying, from the Retry-After header or exponential backoff, capped at MAX_RETRY_DELAY."""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                delay = math.nan  # HTTP-date form is not supported, fall back to backoff
+            # float() also accepts "nan" and "inf", which must not reach asyncio.sleep
+            if math.isfinite(delay):
+                return min(max(delay, 0.0), cls.MAX_RETRY_DELAY)
+        return min(float(2**attempt), cls.MAX_RETRY_DELAY)
+
+    def close(self) -> None:
+        """Close the pooled HTTP client and wake any query still waiting for a rate limit slot."""
+        self._closed.set()
+        self._client.close()
+
+    def _new_async_client(self) -> httpx.AsyncClient:
+        """Create an async HTTP client; callers close it with 'async with' on the same event loop."""
+        # Size the pool to the batch concurrency so in-flight requests never queue for a connection
+        max_concurrency = self.provider_settings.max_concurrency
+        return httpx.AsyncClient(
+            timeout=self.timeout_sec,
+            headers=self.headers,
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency),
+        )
+
+    async def _apost(self, client: httpx.AsyncClient, prompt: RenderedPrompt, model_id: str) -> LLMResponse:
+        """Send one prompt with the given async client, honouring the provider rate limit. Errors are logged by the caller."""
+        delay = self._reserve_rate_limit_slot()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        payload = self._build_payload(prompt, model_id)
+
+        logger.debug("Making async POST request to %s", self.provider_settings.url)
+        response = await client.post(url=str(self.provider_settings.url), json=payload)
+        response.raise_for_status()
+        logger.debug("Response received with status code: %s", response.status_code)
+
+        return self._handle_response(response, model_id, payload)
+
+    def _build_payload(self, prompt: RenderedPrompt, model_id: str) -> dict:
+        """
+        Build the chat completion request payload for a prompt.
 
+        Args:
+            prompt: The rendered prompt to send to the LLM
+            model_id: Model identifier
+
+        Returns:
+            Request payload with messages and the precomputed generation parameters
+        """
         logger.info(f"Sending query to model: {model_id} (strategy: {prompt.strategy_name})")
-        logger.debug(f"System prompt length: {len(prompt.system_prompt)} characters")
-        logger.debug(f"User prompt length: {len(prompt.user_prompt)} characters")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("System prompt length: %d characters", len(prompt.system_prompt))
+            logger.debug("User prompt length: %d characters", len(prompt.user_prompt))
 
         payload = {
             "messages": [
@@ -74,9 +227,19 @@ class GitHubConnector:
             ],
             "model": model_id,
         }
+        payload.update(self._generation_params)
+
+        return payload
 
-        # Merge provider settings with model-specific overrides
-        # Model settings take precedence, then filter out None values
+    def _resolve_generation_params(self) -> dict:
+        """
+        Merge provider generation parameters with model-specific overrides.
+
+        Model settings take precedence, then None values are dropped.
+
+        Returns:
+            Generation parameters to include in every request payload
+        """
         generation_params = {
             "max_tokens": self.provider_settings.max_tokens,
             "temperature": self.provider_settings.temperature,
@@ -89,64 +252,56 @@ class GitHubConnector:
         # Apply model-specific overrides (if any)
         if self.model_settings.additional_settings:
             generation_params.update(self.model_settings.additional_settings)
-            logger.debug(f"Model-specific overrides applied: {self.model_settings.additional_settings}")
+            logger.debug("Model-specific overrides applied: %s", self.model_settings.additional_settings)
 
-        # Log final generation parameters
         active_params = {k: v for k, v in generation_params.items() if v is not None}
-        if active_params:
-            logger.debug(f"Active generation parameters: {active_params}")
-            payload.update(active_params)
+        logger.debug("Active generation parameters: %s", active_params)
+        return active_params
 
-        try:
-            with httpx.Client(timeout=self.timeout_sec) as client:
-                logger.debug(f"Making POST request to {self.provider_settings.url}")
-                response = client.post(
-                    url=str(self.provider_settings.url),  # Convert HttpUrl to string
-                    headers=self.headers,
-                    json=payload,
-                )
-                response.raise_for_status()
-                logger.debug(f"Response received with status code: {response.status_code}")
-
-            data = response.json()
+    def _handle_response(self, response: httpx.Response, model_id: str, payload: dict) -> LLMResponse:
+        """Decode a successful HTTP response and convert it to an LLMResponse."""
+        data = response.json()
 
-            logger.debug(f"Raw response keys: {list(data.keys())}")
-            logger.debug(f"Number of choices: {len(data.get('choices', []))}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Raw response keys: %s", list(data.keys()))
+            logger.debug("Number of choices: %d", len(data.get("choices", [])))
 
-            # Parse GitHub-specific response into our generic format
-            return self._parse_github_response(data, model_id, payload)
+        # Parse GitHub-specific response into our generic format
+        return self._parse_github_response(data, model_id, payload)
 
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error occurred: {e.response.status_code}")
-            logger.error(f"Request URL: {e.request.url}")
-            logger.error(f"Response body: {e.response.text}")
+    def _log_query_error(self, error: Exception) -> None:
+        """Log details about a failed request before it is re-raised."""
+        if isinstance(error, httpx.HTTPStatusError):
+            logger.error(f"HTTP error occurred: {error.response.status_code}")
+            logger.error(f"Request URL: {error.request.url}")
+            logger.error(f"Response body: {error.response.text}")
 
             # Try to parse error details if it's JSON
             try:
-                error_data = e.response.json()
+                error_data = error.response.json()
                 if "error" in error_data:
                     logger.error(f"Error details: {error_data['error']}")
             except Exception:
                 pass  # Response might not be JSON
-
-            raise
-        except httpx.TimeoutException:
+        elif isinstance(error, httpx.TimeoutException):
             logger.error(f"Request timed out after {self.timeout_sec} seconds")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error during query: {type(e).__name__}: {str(e)}")
-            raise
+        else:
+            logger.error(f"Unexpected error during query: {type(error).__name__}: {str(error)}")
 
-    def _apply_rate_limit(self) -> None:
+    def _reserve_rate_limit_slot(self) -> float:
         """
-        Apply rate limiting by waiting if necessary between consecutive requests.
+        Reserve the next request slot for this provider and return how long to wait for it.
 
         Uses a class-level tracker keyed by provider URL to ensure rate limiting
         works across all connector instances for the same provider.
-        Thread-safe using a lock to prevent race conditions.
+        Thread-safe using a lock to prevent race conditions. The slot is reserved
+        while holding the lock, so callers can sleep (or await) outside of it.
+
+        Returns:
+            Seconds to wait before sending the request (0.0 if none)
         """
         if self.provider_settings.rate_limit_delay is None:
-            return
+            return 0.0
 
         provider_key = str(self.provider_settings.url)
 
@@ -157,18 +312,17 @@ class GitHubConnector:
             if last_request_time is None:
                 # First request for this provider
                 self._rate_limit_trackers[provider_key] = current_time
-                logger.debug(f"Rate limiter initialized for provider: {self.provider_settings.provider}")
-                return
-
-            elapsed = current_time - last_request_time
-            remaining_delay = self.provider_settings.rate_limit_delay - elapsed
+                logger.debug("Rate limiter initialized for provider: %s", self.provider_settings.provider)
+                return 0.0
 
-            if remaining_delay > 0:
-                logger.debug(f"Rate limiting: waiting {remaining_delay:.2f} seconds before next request " f"(provider: {self.provider_settings.provider})")
-                time.sleep(remaining_delay)
+            # Requests start no earlier than rate_limit_delay after the previous one
+            next_request_time = max(current_time, last_request_time + self.provider_settings.rate_limit_delay)
+            self._rate_limit_trackers[provider_key] = next_request_time
 
-            # Update the last request time after any delay
-            self._rate_limit_trackers[provider_key] = time.time()
+        remaining_delay = next_request_time - current_time
+        if remaining_delay > 0:
+            logger.debug("Rate limiting: waiting %.2f seconds before next request (provider: %s)", remaining_delay, self.provider_settings.provider)
+        return remaining_delay
 
     def _parse_github_response(self, data: dict, model_id: str, request_payload: dict) -> LLMResponse:
         """
@@ -210,10 +364,10 @@ class GitHubConnector:
 
             logger.info(f"Query completed successfully for model: {model_id}")
             logger.info(f"Tokens used: {total_tokens}, Finish reason: {finish_reason}")
-            logger.debug(f"Response content length: {len(content)} characters")
+            logger.debug("Response content length: %d characters", len(content))
 
             if usage:
-                logger.debug(f"Token breakdown - Prompt: {metadata['prompt_tokens']}, " f"Completion: {metadata['completion_tokens']}, " f"Total: {total_tokens}")
+                logger.debug("Token breakdown - Prompt: %s, Completion: %s, Total: %s", metadata["prompt_tokens"], metadata["completion_tokens"], total_tokens)
 
             return LLMResponse(
                 content=content,
@@ -221,13 +375,13 @@ class GitHubConnector:
                 tokens_used=total_tokens,
                 finish_reason=finish_reason,
                 metadata=metadata,
-                raw_response=data,  # Store complete response for debugging
+                raw_response=data if self.provider_settings.keep_raw_response else None,  # Complete response, for debugging only
                 request_payload=request_payload,  # Store complete request for reproducibility
             )
 
         except (KeyError, IndexError) as e:
             logger.error(f"Failed to parse GitHub response: {e}")
-            logger.debug(f"Response structure: {list(data.keys())}")
+            logger.debug("Response structure: %s", list(data.keys()))
             raise ValueError(f"Invalid GitHub API response structure: {e}") from e
 
     @property
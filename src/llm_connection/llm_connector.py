@@ -23,3 +23,20 @@ class LLMConnector(Protocol):
             LLMResponse with content and metadata
         """
         ...
+
+    async def aquery(self, prompt: RenderedPrompt, provider_id: str, model_id: str) -> LLMResponse:
+        """
+        Asynchronously send prompt to LLM and return response.
+        Args:
+            prompt: The rendered prompt to send to the LLM
+            provider_id: Identifier for the LLM provider
+            model_id: Identifier for the specific model to use
+
+        Returns:
+            LLMResponse with content and metadata
+        """
+        ...
+
+    def close(self) -> None:
+        """Release any resources (e.g. pooled HTTP connections) held by the connector."""
+        ...
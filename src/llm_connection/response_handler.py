@@ -9,8 +9,11 @@ This module provides functionality to:
 """
 
 import ast
+import functools
+import hashlib
 import json
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -20,6 +23,12 @@ from src.model.prompt import RenderedPrompt
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=128)
+def _sanitize_for_filename(value: str) -> str:
+    """Replace '/' and '.' with '_' so identifiers can be used in filenames."""
+    return value.replace("/", "_").replace(".", "_")
+
+
 class CodeValidationError(Exception):
     """Raised when generated code fails validation."""
 
@@ -34,6 +43,9 @@ class ResponseHandler:
     It performs strict validation and saves both the code and metadata separately.
     """
 
+    # Maximum number of validated code digests remembered
+    VALIDATION_CACHE_SIZE = 256
+
     def __init__(self, output_dir: str = "src/auto_generated"):
         """
         Initialize the response handler.
@@ -45,6 +57,16 @@ class ResponseHandler:
         self.implementations_dir = self.output_dir / "implementations"
         self.metadata_dir = self.output_dir / "metadata"
 
+        # Digests of code already known to be valid (insertion-ordered, oldest evicted first)
+        self._validated_digests: dict[bytes, None] = {}
+        # Number of times each filename has been issued within the current second, to keep names unique;
+        # names embed the second, so the counts are reset whenever it changes
+        self._issued_second: str | None = None
+        self._issued_filenames: dict[str, int] = {}
+
+        # Guards the caches above; responses may be processed from several threads
+        self._lock = threading.Lock()
+
         self._ensure_directories()
 
         logger.info(f"ResponseHandler initialized with output directory: {self.output_dir}")
@@ -53,25 +75,37 @@ class ResponseHandler:
         """Create output directories if they don't exist."""
         self.implementations_dir.mkdir(parents=True, exist_ok=True)
         self.metadata_dir.mkdir(parents=True, exist_ok=True)
-        logger.debug(f"Ensured directories exist: {self.implementations_dir}, {self.metadata_dir}")
+        logger.debug("Ensured directories exist: %s, %s", self.implementations_dir, self.metadata_dir)
 
     def validate_python_syntax(self, code: str) -> None:
         """
         Validate that the code is syntactically correct Python.
 
+        Identical code that already passed validation is recognised by its digest and not parsed again.
+
         Args:
             code: Python code string to validate
 
         Raises:
             CodeValidationError: If code has syntax errors
         """
+        digest = hashlib.blake2b(code.encode("utf-8"), digest_size=16).digest()
+        if digest in self._validated_digests:
+            logger.debug("Python syntax validation skipped: identical code already validated")
+            return
+
         try:
-            ast.parse(code)
+            compile(code, "<llm_response>", "exec", flags=ast.PyCF_ONLY_AST, dont_inherit=True)
             logger.debug("Python syntax validation passed")
         except SyntaxError as e:
             logger.error(f"Syntax error in generated code: line {e.lineno}, {e.msg}")
             raise CodeValidationError(f"Generated code has syntax error at line {e.lineno}: {e.msg}") from e
 
+        with self._lock:
+            if len(self._validated_digests) >= self.VALIDATION_CACHE_SIZE:
+                del self._validated_digests[next(iter(self._validated_digests))]
+            self._validated_digests[digest] = None
+
     def generate_filename(
         self,
         model_id: str,
@@ -84,6 +118,9 @@ class ResponseHandler:
 
         Format: {model}_{strategy}_v{version}_{timestamp}.py
 
+        If the same name was already issued by this handler within the same second, a numeric
+        suffix is appended so earlier files are not overwritten.
+
         Args:
             model_id: Full model identifier (e.g., 'openai/gpt-4.1')
             strategy_name: Prompt strategy name (e.g., 'neutral')
@@ -96,18 +133,25 @@ class ResponseHandler:
         if timestamp is None:
             timestamp = datetime.now()
 
-        # Sanitize model_id: replace / and . with _
-        safe_model = model_id.replace("/", "_").replace(".", "_")
+        # Sanitize model_id and version: replace / and . with _
+        safe_model = _sanitize_for_filename(model_id)
+        safe_version = _sanitize_for_filename(prompt_version)
 
         # Format timestamp
         timestamp_str = timestamp.strftime("%Y%m%d_%H%M%S")
 
-        # Replace . in version with underscore
-        safe_version = prompt_version.replace(".", "_")
-
         filename = f"{safe_model}_{strategy_name}_v{safe_version}_{timestamp_str}"
 
-        logger.debug(f"Generated filename: {filename}")
+        with self._lock:
+            if timestamp_str != self._issued_second:
+                self._issued_second = timestamp_str
+                self._issued_filenames.clear()
+            issued = self._issued_filenames.get(filename, 0)
+            self._issued_filenames[filename] = issued + 1
+        if issued:
+            filename = f"{filename}_{issued}"
+
+        logger.debug("Generated filename: %s", filename)
         return filename
 
     def save_implementation(self, code: str, filename_base: str) -> Path:
@@ -181,8 +225,8 @@ class ResponseHandler:
         }
 
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            # Serialize in one call and write once; json.dump would issue a write per encoded chunk
+            filepath.write_text(json.dumps(metadata, indent=2, ensure_ascii=False), encoding="utf-8")
             logger.info(f"Saved metadata to: {filepath}")
             return filepath
         except OSError as e:
@@ -193,7 +237,8 @@ class ResponseHandler:
         """
         Process an LLM response: validate, save code, and save metadata.
 
-        This is the main entry point for handling responses.
+        This is the main entry point for handling responses. Files are written before it
+        returns, so write errors surface here as OSError for the experiment that caused them.
 
         Args:
             response: LLM response containing generated code
@@ -206,6 +251,7 @@ class ResponseHandler:
 
         Raises:
             CodeValidationError: If code validation fails
+            OSError: If the implementation or metadata file cannot be written
         """
         logger.info(f"Processing response from {model_id} using strategy '{prompt.strategy_name}'")
 
@@ -259,7 +305,7 @@ class ResponseHandler:
             logger.info(f"Saved invalid code to: {invalid_path}")
 
             # Save metadata with error information
-            metadata_path = self.save_metadata(
+            self.save_metadata(
                 response=response,
                 prompt=prompt,
                 filename_base=filename_base,
@@ -8,48 +8,85 @@ This module provides a standardized logging setup with:
 - Sanitization of sensitive data (API keys, tokens)
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
+import re
 import sys
 from pathlib import Path
+from typing import TextIO
+
+# Renders tracebacks so SensitiveDataFilter can sanitize them before any handler formats the record
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+# Background listener that owns the file handler, if file logging is enabled
+_queue_listener: logging.handlers.QueueListener | None = None
 
 
 class SensitiveDataFilter(logging.Filter):
     """Filter that sanitizes sensitive data from log messages."""
 
-    SENSITIVE_PATTERNS = ["Bearer ", "token=", "api_key=", "password=", "secret=", "Authorization:"]
+    SENSITIVE_PATTERNS = ("Bearer ", "token=", "api_key=", "password=", "secret=", "Authorization:")
+
+    # One alternation for all patterns, capturing the value up to the next delimiter
+    _SENSITIVE_RE = re.compile("(" + "|".join(map(re.escape, SENSITIVE_PATTERNS)) + ")[^ ,\r\n\"']*", re.IGNORECASE)
 
     def filter(self, record: logging.LogRecord) -> bool:
         """Sanitize sensitive data in log messages."""
-        if hasattr(record, "msg"):
-            msg = str(record.msg)
-            for pattern in self.SENSITIVE_PATTERNS:
-                if pattern.lower() in msg.lower():
-                    record.msg = self._sanitize_message(msg, pattern)
+        # Scan the formatted message: lazily passed %-arguments can carry sensitive data too
+        message = record.getMessage()
+        # Skip records whose formatted message another handler already sanitized
+        if getattr(record, "_sanitized_msg", None) == message:
+            return True
+
+        if self._SENSITIVE_RE.search(message):
+            message = self._sanitize_message(message)
+        # Keep only the sanitized text, so handlers do not merge the raw arguments in again
+        record.msg = message
+        record.args = ()
+        # Exception messages end up in the traceback text; formatters reuse a cached exc_text
+        if record.exc_info and not record.exc_text:
+            record.exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+        if record.exc_text and self._SENSITIVE_RE.search(record.exc_text):
+            record.exc_text = self._sanitize_message(record.exc_text)
+        record._sanitized_msg = message
         return True
 
-    def _sanitize_message(self, msg: str, pattern: str) -> str:
+    def _sanitize_message(self, msg: str) -> str:
         """Replace sensitive data with asterisks while preserving context."""
-        msg_lower = msg.lower()
-        pattern_lower = pattern.lower()
+        return self._SENSITIVE_RE.sub(r"\1***REDACTED***", msg)
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that writes through a large buffer and flushes only for severe records.
+
+    Lower-severity records are written out when the buffer fills or the handler is closed.
+    """
 
-        if pattern_lower in msg_lower:
-            # Find the pattern and mask the following value
-            idx = msg_lower.find(pattern_lower)
-            before = msg[: idx + len(pattern)]
-            after_start = idx + len(pattern)
+    BUFFER_SIZE = 64 * 1024
 
-            # Find the end of the sensitive value (space, comma, newline, or end of string)
-            end_chars = [" ", ",", "\n", "\r", '"', "'"]
-            end_idx = len(msg)
-            for char in end_chars:
-                pos = msg.find(char, after_start)
-                if pos != -1 and pos < end_idx:
-                    end_idx = pos
+    def __init__(self, filename: str | Path, encoding: str | None = None, flush_level: int = logging.ERROR):
+        self.flush_level = flush_level
+        super().__init__(filename, encoding=encoding)
 
-            masked = before + "***REDACTED***" + msg[end_idx:]
-            return masked
+    def _open(self) -> TextIO:
+        """Open the log file with a large write buffer."""
+        return open(self.baseFilename, self.mode, buffering=self.BUFFER_SIZE, encoding=self.encoding, errors=self.errors)
 
-        return msg
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record, flushing only at or above flush_level."""
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 def setup_logging(log_level: str = "INFO", log_file: str | None = None, enable_console: bool = True) -> None:
@@ -67,17 +104,20 @@ def setup_logging(log_level: str = "INFO", log_file: str | None = None, enable_c
     root_logger.setLevel(numeric_level)
 
     # Remove existing handlers
+    _stop_queue_listener()
     root_logger.handlers.clear()
 
     # Create formatter
     formatter = logging.Formatter(fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+    # One filter instance shared by all handlers
+    sensitive_filter = SensitiveDataFilter()
 
     # Console handler
     if enable_console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(numeric_level)
         console_handler.setFormatter(formatter)
-        console_handler.addFilter(SensitiveDataFilter())
+        console_handler.addFilter(sensitive_filter)
         root_logger.addHandler(console_handler)
 
     # File handler
@@ -85,11 +125,21 @@ def setup_logging(log_level: str = "INFO", log_file: str | None = None, enable_c
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        file_handler = logging.FileHandler(log_path, encoding="utf-8")
+        file_handler = BufferedFileHandler(log_path, encoding="utf-8")
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(formatter)
-        file_handler.addFilter(SensitiveDataFilter())
-        root_logger.addHandler(file_handler)
+        file_handler.addFilter(sensitive_filter)
+
+        # Disk writes happen on the listener thread; callers only enqueue records
+        log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+        # Sanitize before enqueueing too, so queued records never hold the raw message
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.addFilter(sensitive_filter)
+        root_logger.addHandler(queue_handler)
+
+        global _queue_listener
+        _queue_listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _queue_listener.start()
 
     # Set specific log levels for third-party libraries
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -101,6 +151,21 @@ def setup_logging(log_level: str = "INFO", log_file: str | None = None, enable_c
         root_logger.info(f"Logging to file: {log_file}")
 
 
+def _stop_queue_listener() -> None:
+    """Stop the file logging listener, flushing queued records and closing the file."""
+    global _queue_listener
+    if _queue_listener is None:
+        return
+
+    _queue_listener.stop()
+    for handler in _queue_listener.handlers:
+        handler.close()
+    _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a specific module.
@@ -16,16 +16,22 @@ Configuration is controlled via:
     - settings/prompts/*.prompt.yml (prompt templates; each strategy must have a corresponding '*.prompt.yml' file)
 """
 
+import itertools
+import logging
 import sys
-from datetime import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
 from pathlib import Path
 
-from src.llm_connection.connector_factory import create_connector
+from src.llm_connection.connector_factory import close_connectors, create_connector
 from src.llm_connection.response_handler import CodeValidationError, ResponseHandler
 from src.logging_config import get_logger, setup_logging
+from src.model.prompt import RenderedPrompt
 from src.prompts.prompt_builder import PromptBuilder
 from src.prompts.prompt_loader import PromptLoader
-from src.settings.settings_model import LlmSettings, SecretSettings
+from src.settings.settings_model import LlmSettings, SecretSettings, get_llm_settings, get_secret_settings
 
 logger = get_logger(__name__)
 
@@ -56,6 +62,7 @@ class ExperimentRunner:
         self.response_handler = response_handler
         self.prompt_loader = prompt_loader
         self.prompt_builder = prompt_builder
+        self._prompt_cache: dict[str, RenderedPrompt] = {}
 
         self.stats = {
             "total_experiments": 0,
@@ -65,6 +72,8 @@ class ExperimentRunner:
             "models_tested": set(),
             "strategies_tested": set(),
         }
+        # Experiments run concurrently in run_all, so stats updates are serialized
+        self._stats_lock = threading.Lock()
 
     def run_single_experiment(self, model_id: str, strategy_name: str) -> bool:
         """
@@ -77,50 +86,94 @@ class ExperimentRunner:
         Returns:
             True if successful, False otherwise
         """
-        logger.info(f"Starting experiment: model={model_id}, strategy={strategy_name}")
+        logger.info("Starting experiment: model=%s, strategy=%s", model_id, strategy_name)
 
         try:
             # Load and build prompt
-            logger.info(f"Loading prompt strategy: {strategy_name}")
-            template = self.prompt_loader.load_prompt(strategy_name)
-            prompt = self.prompt_builder.build_prompt(template)
+            prompt = self._get_prompt(strategy_name)
 
             # Create connector
-            logger.info(f"Creating connector for model: {model_id}")
+            logger.info("Creating connector for model: %s", model_id)
 
             # Extract provider from model settings
-            model_cfg = next((m for m in self.settings.models_settings if m.model_id == model_id), None)
+            model_cfg = self.settings.models_by_id.get(model_id)
             if not model_cfg:
-                logger.error(f"Model {model_id} not found in settings")
+                logger.error("Model %s not found in settings", model_id)
                 return False
 
             provider_id = model_cfg.provider
             connector = create_connector(model_id, self.settings, self.secrets)
 
             # Query the model
-            logger.info(f"Querying model: {model_id}")
+            logger.info("Querying model: %s", model_id)
             response = connector.query(prompt, provider_id, model_id)
 
-            logger.info(f"Received response: {len(response.content)} characters, " f"{response.tokens_used or 'unknown'} tokens")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Received response: %d characters, %s tokens", len(response.content), response.tokens_used or "unknown")
 
             # Process and save response
             logger.info("Processing and saving response")
             code_path, metadata_path = self.response_handler.process_response(response=response, prompt=prompt, model_id=model_id, provider_id=provider_id)
 
-            logger.info(f"Experiment successful: {code_path.name}")
-            self.stats["successful"] += 1
+            logger.info("Experiment successful: %s", code_path.name)
+            self._increment_stat("successful")
             return True
 
         except CodeValidationError as e:
-            logger.warning(f"Code validation failed: {e}")
-            self.stats["failed_validation"] += 1
+            logger.warning("Code validation failed: %s", e)
+            self._increment_stat("failed_validation")
             return False
 
         except Exception as e:
             logger.error(f"Experiment failed with error: {e}", exc_info=True)
-            self.stats["failed_generation"] += 1
+            self._increment_stat("failed_generation")
             return False
 
+    def _increment_stat(self, key: str) -> None:
+        """Increment a counter in the stats dictionary."""
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _record_planned(self, models: list[str], strategies: list[str]) -> None:
+        """Count every (model, strategy) pair about to run in the stats."""
+        with self._stats_lock:
+            self.stats["total_experiments"] += len(models) * len(strategies)
+            self.stats["models_tested"].update(models)
+            self.stats["strategies_tested"].update(strategies)
+
+    def _run_and_report(self, model_id: str, strategy_name: str) -> bool:
+        """
+        Run a single experiment and log its outcome.
+
+        Args:
+            model_id: Model identifier
+            strategy_name: Prompt strategy name
+
+        Returns:
+            True if successful, False otherwise
+        """
+        success = self.run_single_experiment(model_id, strategy_name)
+
+        if success:
+            logger.info("Completed: %s x %s", model_id, strategy_name)
+        else:
+            logger.warning("Failed: %s x %s", model_id, strategy_name)
+        return success
+
+    def _get_prompt(self, strategy_name: str) -> RenderedPrompt:
+        """
+        Return the rendered prompt for a strategy, building it on first use.
+
+        Prompts depend only on the strategy, so each one is rendered once and shared across models.
+        """
+        prompt = self._prompt_cache.get(strategy_name)
+        if prompt is None:
+            logger.info("Loading prompt strategy: %s", strategy_name)
+            template = self.prompt_loader.load_prompt(strategy_name)
+            prompt = self.prompt_builder.build_prompt(template)
+            self._prompt_cache[strategy_name] = prompt
+        return prompt
+
     def run_for_model(self, model_id: str, strategies: list[str]) -> dict[str, bool]:
         """
         Run experiments for a single model across all specified strategies.
@@ -132,29 +185,20 @@ class ExperimentRunner:
         Returns:
             Dictionary mapping strategy name to success status
         """
-        logger.info(f"Running experiments for model: {model_id}")
-        logger.info(f"Strategies to test: {', '.join(strategies)}")
-
-        results = {}
-        for strategy_name in strategies:
-            self.stats["total_experiments"] += 1
-            self.stats["models_tested"].add(model_id)
-            self.stats["strategies_tested"].add(strategy_name)
-
-            success = self.run_single_experiment(model_id, strategy_name)
-            results[strategy_name] = success
-
-            if success:
-                logger.info(f"Completed: {model_id} x {strategy_name}")
-            else:
-                logger.warning(f"Failed: {model_id} x {strategy_name}")
+        logger.info("Running experiments for model: %s", model_id)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Strategies to test: %s", ", ".join(strategies))
 
-        return results
+        self._record_planned([model_id], strategies)
+        return {strategy_name: self._run_and_report(model_id, strategy_name) for strategy_name in strategies}
 
     def run_all(self, models: list[str] | None = None, strategies: list[str] | None = None) -> dict[str, dict[str, bool]]:
         """
         Run experiments for all specified models and strategies.
 
+        Experiments are independent and network-bound, so they run concurrently on up to
+        settings.max_parallel_experiments threads.
+
         Args:
             models: List of model IDs to test (defaults to all enabled models)
             strategies: List of strategies to test (defaults to all configured strategies)
@@ -166,35 +210,52 @@ class ExperimentRunner:
         models = models or self.settings.enabled_models
         strategies = strategies or self.settings.prompt_strategies
 
-        logger.info("Starting experiment batch")
-        logger.info(f"Models: {', '.join(models)}")
-        logger.info(f"Strategies: {', '.join(strategies)}")
-        logger.info(f"Total experiments: {len(models) * len(strategies)}")
+        plan = list(itertools.product(models, strategies))
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Starting experiment batch")
+            logger.info("Models: %s", ", ".join(models))
+            logger.info("Strategies: %s", ", ".join(strategies))
+            logger.info("Total experiments: %d", len(plan))
 
-        all_results = {}
+        self._record_planned(models, strategies)
 
-        for model_id in models:
-            logger.info(f"Processing model {model_id}")
-            model_results = self.run_for_model(model_id, strategies)
-            all_results[model_id] = model_results
+        outcomes: dict[tuple[str, str], bool] = {}
+        executor = ThreadPoolExecutor(max_workers=self.settings.max_parallel_experiments, thread_name_prefix="experiment")
+        try:
+            futures = {executor.submit(self._run_and_report, *pair): pair for pair in plan}
+            for future in as_completed(futures):
+                outcomes[futures[future]] = future.result()
+        except BaseException:
+            # On Ctrl-C (or any error) drop the queued experiments instead of running them all first
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown(wait=True)
 
-        return all_results
+        return {model_id: {strategy_name: outcomes[model_id, strategy_name] for strategy_name in strategies} for model_id in models}
 
     def print_summary(self) -> None:
         """Print experiment summary statistics."""
-        logger.info("=" * 60)
-        logger.info("Experiment Summary:")
-        logger.info(f"  Total experiments: {self.stats['total_experiments']}")
-        logger.info(f"  Successful: {self.stats['successful']}")
-        logger.info(f"  Failed (validation): {self.stats['failed_validation']}")
-        logger.info(f"  Failed (generation): {self.stats['failed_generation']}")
-        logger.info(f"  Models tested: {len(self.stats['models_tested'])}")
-        logger.info(f"  Strategies tested: {len(self.stats['strategies_tested'])}")
-
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        lines = [
+            "=" * 60,
+            "Experiment Summary:",
+            f"  Total experiments: {self.stats['total_experiments']}",
+            f"  Successful: {self.stats['successful']}",
+            f"  Failed (validation): {self.stats['failed_validation']}",
+            f"  Failed (generation): {self.stats['failed_generation']}",
+            f"  Models tested: {len(self.stats['models_tested'])}",
+            f"  Strategies tested: {len(self.stats['strategies_tested'])}",
+        ]
         if self.stats["total_experiments"] > 0:
             success_rate = self.stats["successful"] / self.stats["total_experiments"] * 100
-            logger.info(f"  Success rate: {success_rate:.1f}%")
-        logger.info("=" * 60)
+            lines.append(f"  Success rate: {success_rate:.1f}%")
+        lines.append("=" * 60)
+
+        # One record for the whole summary: a single filter pass and write per handler
+        logger.info("\n".join(lines))
 
 
 def load_settings() -> tuple[LlmSettings, SecretSettings]:
@@ -211,21 +272,21 @@ def load_settings() -> tuple[LlmSettings, SecretSettings]:
     secrets_path = "settings/secrets.env"
 
     logger.info("Loading configuration")
-    logger.debug(f"Config file: {config_path}")
-    logger.debug(f"Secrets file: {secrets_path}")
+    logger.debug("Config file: %s", config_path)
+    logger.debug("Secrets file: %s", secrets_path)
 
     # Check if files exist
     if not Path(config_path).exists():
-        logger.error(f"Configuration file not found: {config_path}")
+        logger.error("Configuration file not found: %s", config_path)
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
     if not Path(secrets_path).exists():
-        logger.error(f"Secrets file not found: {secrets_path}")
+        logger.error("Secrets file not found: %s", secrets_path)
         raise FileNotFoundError(f"Secrets file not found: {secrets_path}")
 
     # Load settings - Pydantic will automatically load from YAML via YamlConfigSettingsSource
-    settings = LlmSettings()
-    secrets = SecretSettings(_env_file=secrets_path)
+    settings = get_llm_settings()
+    secrets = get_secret_settings(secrets_path)
 
     logger.info("Configuration loaded successfully")
     return settings, secrets
@@ -239,13 +300,15 @@ def main() -> int:
         Exit code (0 for success, 1 for failure)
     """
     start_time = datetime.now()
+    # Monotonic clock for the duration, unaffected by wall-clock adjustments
+    start_monotonic = time.monotonic()
 
     # Setup logging with both console and file output
     log_filename = f"logs/experiment_{start_time.strftime('%Y%m%d_%H%M%S')}.log"
     setup_logging(log_level="DEBUG", log_file=log_filename)
 
     logger.info("LLM Compensation Bias Experiment")
-    logger.info(f"Start time: {start_time.isoformat()}")
+    logger.info("Start time: %s", start_time.isoformat())
     logger.info("-" * 60)
 
     try:
@@ -253,11 +316,12 @@ def main() -> int:
         settings, secrets = load_settings()
 
         # Show what will be run
-        logger.info("Experiment Configuration:")
-        logger.info(f"  Models: {', '.join(settings.enabled_models)}")
-        logger.info(f"  Strategies: {', '.join(settings.prompt_strategies)}")
-        logger.info(f"  Total experiments: {len(settings.enabled_models) * len(settings.prompt_strategies)}")
-        logger.info(f"  Output directory: {settings.output_dir}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Experiment Configuration:")
+            logger.info("  Models: %s", ", ".join(settings.enabled_models))
+            logger.info("  Strategies: %s", ", ".join(settings.prompt_strategies))
+            logger.info("  Total experiments: %d", len(settings.enabled_models) * len(settings.prompt_strategies))
+            logger.info("  Output directory: %s", settings.output_dir)
         logger.info("-" * 60)
 
         # Initialize components
@@ -278,7 +342,10 @@ def main() -> int:
         # Run experiments
         logger.info("Starting experiments")
         logger.info("=" * 60)
-        _ = runner.run_all()
+        try:
+            _ = runner.run_all()
+        finally:
+            close_connectors()
         logger.info("=" * 60)
 
         # Print summary
@@ -286,9 +353,9 @@ def main() -> int:
 
         # Calculate duration
         end_time = datetime.now()
-        duration = end_time - start_time
-        logger.info(f"End time: {end_time.isoformat()}")
-        logger.info(f"Total duration: {duration}")
+        duration = timedelta(seconds=time.monotonic() - start_monotonic)
+        logger.info("End time: %s", end_time.isoformat())
+        logger.info("Total duration: %s", duration)
 
         # Return success if at least some experiments succeeded
         if runner.stats["successful"] > 0:
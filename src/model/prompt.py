@@ -2,10 +2,13 @@
 Pydantic models for structured prompt templates.
 """
 
-import string
+import re
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+# "{{" and "}}" are literal braces in a format string, not replacement fields
+_ESCAPED_BRACES = re.compile(r"\{\{|\}\}")
+
 
 class PromptTemplate(BaseModel):
     """
@@ -46,10 +49,10 @@ class RenderedPrompt(PromptTemplate):
     @model_validator(mode="after")
     def check_no_placeholders(self) -> "RenderedPrompt":
         def _has_placeholders(template: str) -> bool:
-            for _, field_name, _, _ in string.Formatter().parse(template):
-                if field_name is not None:
-                    return True
-            return False
+            # Escaped braces pair up left to right as in str.format; any brace left over
+            # opens a replacement field (or is a stray brace str.format would reject)
+            unescaped = _ESCAPED_BRACES.sub("", template)
+            return "{" in unescaped or "}" in unescaped
 
         if _has_placeholders(self.system_prompt):
             raise ValueError("system_prompt contains unresolved placeholders")
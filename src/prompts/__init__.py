@@ -1,9 +1,32 @@
 """
 Prompt management components for loading and structuring LLM prompts.
+
+Exports are imported on first access, so importing this package does not pull in
+pydantic, PyYAML or the prompt builder's source introspection until they are used.
 """
 
-from ..model.prompt import PromptTemplate
-from .prompt_builder import PromptBuilder
-from .prompt_loader import PromptLoader
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ..model.prompt import PromptTemplate
+    from .prompt_builder import PromptBuilder
+    from .prompt_loader import PromptLoader
+
+# Exported name -> module (relative to this package) that defines it
+_LAZY_EXPORTS = {
+    "PromptTemplate": "..model.prompt",
+    "PromptLoader": ".prompt_loader",
+    "PromptBuilder": ".prompt_builder",
+}
 
 __all__ = ["PromptTemplate", "PromptLoader", "PromptBuilder"]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -2,8 +2,11 @@
 Prompt builder for formatting prompt templates with code snippets.
 """
 
+import functools
 import inspect
 import logging
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from ..compensation_api.evaluator import CompensationEvaluator
@@ -12,6 +15,9 @@ from ..model.prompt import PromptTemplate, RenderedPrompt
 
 logger = logging.getLogger(__name__)
 
+# Doubles curly braces in a single pass so text survives str.format unchanged
+_BRACE_ESCAPES = str.maketrans({"{": "{{", "}": "}}"})
+
 
 class PromptBuilder:
     """
@@ -22,29 +28,17 @@ class PromptBuilder:
     """
 
     def __init__(self) -> None:
-        # Extract entire person.py file (includes all Enums and the Person class)
-        self.person_code = self._extract_module_code(Person)
-        # Extract just the CompensationEvaluator protocol
-        self.evaluator_code = self._extract_source_code(CompensationEvaluator)
-
-        logger.info(f"Extracted person.py module: {len(self.person_code)} characters")
-        logger.info(f"Extracted CompensationEvaluator code: {len(self.evaluator_code)} characters")
-
-        # Escape curly braces in the code by doubling them for .format()
-        # This prevents Python f-strings in the code from being interpreted as format placeholders
-        person_code_escaped = self.person_code.replace("{", "{{").replace("}", "}}")
-        evaluator_code_escaped = self.evaluator_code.replace("{", "{{").replace("}", "}}")
-
-        self.substitutions = {
-            "person_code": person_code_escaped,
-            "evaluator_code": evaluator_code_escaped,
-        }
-        logger.debug("Completed code extraction and escaping for prompt substitutions.")
+        # Extraction and escaping run once per process and are shared by all builders
+        self.person_code, self.evaluator_code, self.substitutions = _load_code_substitutions()
+        # Rendered prompts by template; templates are frozen, so they are hashable and safe as keys
+        self._rendered_cache: dict[PromptTemplate, RenderedPrompt] = {}
 
     def build_prompt(self, template: PromptTemplate) -> RenderedPrompt:
         """
         Build a complete prompt from a template by substituting code placeholders.
 
+        Rendering is deterministic, so each distinct template is rendered once and the result reused.
+
         Args:
             template: The prompt template with placeholders
 
@@ -57,67 +51,118 @@ class PromptBuilder:
             >>> builder = PromptBuilder()
             >>> rendered = builder.build_prompt(template)
         """
-        logger.debug(f"Building prompt for strategy: {template.strategy_name}")
+        cached = self._rendered_cache.get(template)
+        if cached is not None:
+            logger.debug("Reusing rendered prompt for strategy: %s", template.strategy_name)
+            return cached
+
+        logger.debug("Building prompt for strategy: %s", template.strategy_name)
 
-        system_prompt = template.system_prompt.format(**self.substitutions)
-        user_prompt = template.user_prompt.format(**self.substitutions)
+        system_prompt = template.system_prompt.format_map(self.substitutions)
+        user_prompt = template.user_prompt.format_map(self.substitutions)
 
-        # This also validates that no placeholders remain
-        rendered = RenderedPrompt(
+        # Fields come from an already validated template, so only the placeholder check needs to run
+        rendered = RenderedPrompt.model_construct(
             system_prompt=system_prompt,
             user_prompt=user_prompt,
             strategy_name=template.strategy_name,
             description=template.description,
             version=template.version,
         )
+        rendered.check_no_placeholders()
+
+        logger.info("Successfully built prompt for strategy: %s", template.strategy_name)
+
+        # Size statistics are only computed when they will be logged
+        if logger.isEnabledFor(logging.DEBUG):
+            # Estimate token usage with different rates for natural language vs code
+            # Natural language (template text): ~1 token per 4 chars
+            # Code (person.py + evaluator.py): ~1 token per 2.5 chars (code is more dense)
+            template_chars = len(template.system_prompt) + len(template.user_prompt)
+            code_chars = len(self.person_code) + len(self.evaluator_code)
+
+            template_tokens = template_chars // 4
+            code_tokens = code_chars // 2.5
+            estimated_total_tokens = int(template_tokens + code_tokens)
+
+            logger.debug(
+                "System prompt length: %d characters, user prompt length: %d characters, estimated input tokens: ~%d (~%d from template, ~%d from code)",
+                len(system_prompt),
+                len(user_prompt),
+                estimated_total_tokens,
+                template_tokens,
+                int(code_tokens),
+            )
+
+        self._rendered_cache[template] = rendered
+        return rendered
+
 
-        logger.info(f"Successfully built prompt for strategy: {template.strategy_name}")
+@functools.cache
+def _extract_source_code(cls: type[Any]) -> str:
+    """
+    Extract the source code of a class or protocol. Results are cached per class.
+    """
+    return inspect.getsource(cls)
 
-        # Estimate token usage with different rates for natural language vs code
-        # Natural language (template text): ~1 token per 4 chars
-        # Code (person.py + evaluator.py): ~1 token per 2.5 chars (code is more dense)
-        template_chars = len(template.system_prompt) + len(template.user_prompt)
-        code_chars = len(self.person_code) + len(self.evaluator_code)
 
-        template_tokens = template_chars // 4
-        code_tokens = code_chars // 2.5
-        estimated_total_tokens = int(template_tokens + code_tokens)
+@functools.cache
+def _extract_module_code(cls: type[Any]) -> str:
+    """
+    Extract the entire source file of the module containing a class.
 
-        logger.debug(f"System prompt length: {len(system_prompt)} characters")
-        logger.debug(f"User prompt length: {len(user_prompt)} characters")
-        logger.debug(f"Estimated input tokens: ~{estimated_total_tokens} " f"(~{template_tokens} from template, ~{int(code_tokens)} from code)")
+    This is useful for including all related Enums, constants, and supporting
+    code that provide context for the main class. Results are cached per class.
 
-        return rendered
+    Args:
+        cls: A class whose module source should be extracted
 
-    def _extract_source_code(self, cls: type[Any]) -> str:
-        """
-        Extract the source code of a class or protocol.
-        """
+    Returns:
+        Complete source code of the module file
+    """
+    module = inspect.getmodule(cls)
+    if module is None:
+        logger.warning(f"Could not find module for {cls.__name__}, falling back to class source")
         return inspect.getsource(cls)
 
-    def _extract_module_code(self, cls: type[Any]) -> str:
-        """
-        Extract the entire source file of the module containing a class.
+    module_file = inspect.getsourcefile(module)
+    if module_file is None:
+        logger.warning(f"Could not find source file for module {module.__name__}, falling back to class source")
+        return inspect.getsource(cls)
 
-        This is useful for including all related Enums, constants, and supporting
-        code that provide context for the main class.
+    logger.debug(f"Reading entire module file: {module_file}")
+    with open(module_file, encoding="utf-8") as f:
+        return f.read()
 
-        Args:
-            cls: A class whose module source should be extracted
 
-        Returns:
-            Complete source code of the module file
-        """
-        module = inspect.getmodule(cls)
-        if module is None:
-            logger.warning(f"Could not find module for {cls.__name__}, falling back to class source")
-            return inspect.getsource(cls)
-
-        module_file = inspect.getsourcefile(module)
-        if module_file is None:
-            logger.warning(f"Could not find source file for module {module.__name__}, falling back to class source")
-            return inspect.getsource(cls)
-
-        logger.debug(f"Reading entire module file: {module_file}")
-        with open(module_file, encoding="utf-8") as f:
-            return f.read()
+@functools.cache
+def _load_code_substitutions() -> tuple[str, str, Mapping[str, str]]:
+    """
+    Extract the code injected into prompts and escape it for substitution.
+
+    The sources are static for the life of the process, so this runs once.
+
+    Returns:
+        Tuple of (person.py source, CompensationEvaluator source, read-only substitutions mapping)
+    """
+    # Extract entire person.py file (includes all Enums and the Person class)
+    person_code = _extract_module_code(Person)
+    # Extract just the CompensationEvaluator protocol
+    evaluator_code = _extract_source_code(CompensationEvaluator)
+
+    logger.info(f"Extracted person.py module: {len(person_code)} characters")
+    logger.info(f"Extracted CompensationEvaluator code: {len(evaluator_code)} characters")
+
+    # Escape curly braces in the code by doubling them for .format()
+    # This prevents Python f-strings in the code from being interpreted as format placeholders
+    person_code_escaped = person_code.translate(_BRACE_ESCAPES)
+    evaluator_code_escaped = evaluator_code.translate(_BRACE_ESCAPES)
+
+    substitutions = MappingProxyType(
+        {
+            "person_code": person_code_escaped,
+            "evaluator_code": evaluator_code_escaped,
+        }
+    )
+    logger.debug("Completed code extraction and escaping for prompt substitutions.")
+    return person_code, evaluator_code, substitutions
@@ -5,11 +5,12 @@ Prompt files must have the suffix '*.prompt.yml'.
 """
 
 import logging
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import yaml
-
-from ..model.prompt import PromptTemplate
+if TYPE_CHECKING:
+    from ..model.prompt import PromptTemplate
 
 logger = logging.getLogger(__name__)
 
@@ -27,12 +28,16 @@ class PromptLoader:
             prompts_directory: Path to directory containing '*.prompt.yml' files
         """
         self.prompts_dir = Path(prompts_directory)
+        # Prompt files do not change during a run, so each strategy is parsed only once
+        self._cache: dict[str, PromptTemplate] = {}
         logger.info(f"PromptLoader initialized with directory: {self.prompts_dir}")
 
-    def load_prompt(self, strategy_name: str) -> PromptTemplate:
+    def load_prompt(self, strategy_name: str) -> "PromptTemplate":
         """
         Load a prompt strategy from its '*.prompt.yml' file as a validated PromptTemplate.
 
+        Templates are cached per strategy name, so repeated calls do not re-read the file.
+
             Args:
                 strategy_name: Name of the prompt strategy (e.g., 'neutral', 'fair')
 
@@ -43,6 +48,16 @@ class PromptLoader:
                 FileNotFoundError: If prompt file doesn't exist
                 ValidationError: If prompt file structure is invalid (via Pydantic)
         """
+        cached = self._cache.get(strategy_name)
+        if cached is not None:
+            logger.debug(f"Using cached prompt strategy: {strategy_name}")
+            return cached
+
+        # Deferred so listing prompts does not import PyYAML or pydantic
+        import yaml
+
+        from ..model.prompt import PromptTemplate
+
         prompt_file = self.prompts_dir / f"{strategy_name}{prompt_suffix}"
         logger.debug(f"Loading prompt strategy: {strategy_name} from {prompt_file}")
 
@@ -50,8 +65,9 @@ class PromptLoader:
             logger.error(f"Prompt file not found: {prompt_file}")
             raise FileNotFoundError(f"Prompt file not found: {prompt_file}")
 
-        with open(prompt_file, encoding="utf-8") as f:
-            prompt_data = yaml.safe_load(f)
+        # Use the libyaml-backed loader when available; it parses the raw UTF-8 bytes in C
+        yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        prompt_data = yaml.load(prompt_file.read_bytes(), Loader=yaml_loader)
 
         if not isinstance(prompt_data, dict):
             logger.error(f"Invalid prompt file format: {prompt_file}")
@@ -61,12 +77,14 @@ class PromptLoader:
         if "strategy_name" not in prompt_data:
             prompt_data["strategy_name"] = strategy_name
 
-        # Pydantic validates structure, types, and required fields
-        template = PromptTemplate(**prompt_data)
+        # Pydantic validates structure, types, and required fields; model_validate hands the
+        # parsed dict straight to the compiled validator without re-packing it as keyword arguments
+        template = PromptTemplate.model_validate(prompt_data)
+        self._cache[strategy_name] = template
         logger.info(f"Successfully loaded prompt strategy: {strategy_name}")
         return template
 
-    def load_all_prompts(self) -> dict[str, PromptTemplate]:
+    def load_all_prompts(self) -> dict[str, "PromptTemplate"]:
         """
         Load all available prompt strategies as PromptTemplate instances.
 
@@ -74,15 +92,25 @@ class PromptLoader:
             Dictionary mapping strategy name to PromptTemplate
         """
         logger.info("Loading all available prompt strategies")
-        prompts = {}
-        for prompt_file in self.prompts_dir.glob(f"*{prompt_suffix}"):
-            strategy_name = prompt_file.stem
-            prompts[strategy_name] = self.load_prompt(strategy_name)
+        prompts = {strategy_name: self.load_prompt(strategy_name) for strategy_name in self._scan_strategy_names()}
         logger.info(f"Loaded {len(prompts)} prompt strategies: {', '.join(prompts.keys())}")
         return prompts
 
     def get_available_prompts(self) -> list[str]:
         """Get list of available prompt strategy names."""
-        available = [f.stem for f in self.prompts_dir.glob(f"*{prompt_suffix}")]
+        available = self._scan_strategy_names()
         logger.debug(f"Available prompt strategies: {', '.join(available)}")
         return available
+
+    def _scan_strategy_names(self) -> list[str]:
+        """
+        List strategy names of the '*.prompt.yml' files in the prompts directory, in a single directory pass.
+
+        The full prompt suffix is stripped, so the names can be passed to load_prompt().
+        """
+        try:
+            with os.scandir(self.prompts_dir) as entries:
+                return sorted(entry.name.removesuffix(prompt_suffix) for entry in entries if entry.name.endswith(prompt_suffix) and entry.is_file())
+        except FileNotFoundError:
+            logger.warning(f"Prompt directory not found: {self.prompts_dir}")
+            return []
@@ -2,6 +2,6 @@
 Configuration models for the LLM compensation bias experiment.
 """
 
-from .settings_model import LlmSettings, SecretSettings
+from .settings_model import LlmSettings, SecretSettings, get_llm_settings, get_secret_settings
 
-__all__ = ["SecretSettings", "LlmSettings"]
+__all__ = ["SecretSettings", "LlmSettings", "get_llm_settings", "get_secret_settings"]
@@ -1,6 +1,10 @@
+import functools
 import logging
+from pathlib import Path
+from typing import Any
 
-from pydantic import BaseModel, Field, SecretStr, field_validator
+import yaml
+from pydantic import BaseModel, ConfigDict, Field, SecretStr, field_validator, model_validator
 from pydantic.networks import HttpUrl
 from pydantic_settings import (
     BaseSettings,
@@ -11,6 +15,26 @@ from pydantic_settings import (
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when PyYAML was built with it, pure-Python otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Configuration shared by every settings class; each class adds its own sources
+_COMMON_SETTINGS_CONFIG = SettingsConfigDict(
+    frozen=True,
+    extra="forbid",
+    validate_default=True,
+    case_sensitive=False,
+    use_enum_values=True,
+)
+
+
+class CSafeYamlConfigSettingsSource(YamlConfigSettingsSource):
+    """YAML settings source that parses with libyaml's CSafeLoader instead of yaml.safe_load."""
+
+    def _read_file(self, file_path: Path) -> dict[str, Any]:
+        with file_path.open(encoding=self.yaml_file_encoding) as yaml_file:
+            return yaml.load(yaml_file, Loader=_YAML_LOADER) or {}
+
 
 class SecretSettings(BaseSettings):
     """Base settings model with common configuration."""
@@ -18,11 +42,7 @@ class SecretSettings(BaseSettings):
     gitHub_token: SecretStr = Field(..., description="GitHub Personal Access Token")
 
     model_config = SettingsConfigDict(
-        frozen=True,
-        extra="forbid",
-        validate_default=True,
-        case_sensitive=False,
-        use_enum_values=True,
+        **_COMMON_SETTINGS_CONFIG,
         env_file="secrets.env",
         env_file_encoding="utf-8",
         env_ignore_empty=True,
@@ -49,6 +69,8 @@ class ModelSettings(BaseModel):
         """Convert None to empty dict for additional_settings."""
         return {} if v is None else v
 
+    model_config = ConfigDict(frozen=True)
+
 
 class ProviderSettings(BaseModel):
     """Configuration for an LLM provider."""
@@ -63,6 +85,15 @@ class ProviderSettings(BaseModel):
         description="Minimum delay in seconds between consecutive requests to this provider. Use this to throttle API calls and avoid rate limits.",
         ge=0.0,
     )
+    max_concurrency: int = Field(
+        8,
+        description="Maximum number of concurrent in-flight requests to this provider when querying in batches.",
+        ge=1,
+    )
+    keep_raw_response: bool = Field(
+        False,
+        description="Keep the complete decoded API response on each LLMResponse for debugging. Off by default to save memory.",
+    )
 
     # Generation parameters (applied to all models using this provider)
     max_tokens: int | None = Field(
@@ -99,6 +130,8 @@ class ProviderSettings(BaseModel):
         description="One or more strings that, when generated, will cut off the model's response. Use this to prevent overly long outputs or enforce formatting rules.",
     )
 
+    model_config = ConfigDict(frozen=True)
+
 
 class LlmSettings(BaseSettings):
     """Experiment configuration from YAML."""
@@ -118,15 +151,14 @@ class LlmSettings(BaseSettings):
     prompt_directory: str = Field("settings/prompts", description="Directory containing prompt YAML files")
     prompt_strategies: list[str] = Field(default_factory=list)
 
+    # EXECUTION
+    max_parallel_experiments: int = Field(4, description="Maximum number of experiments run concurrently", ge=1)
+
     # OUTPUT
     output_dir: str = Field("src/auto_generated", description="Directory to save output results")
 
     model_config = SettingsConfigDict(
-        frozen=True,
-        extra="forbid",
-        validate_default=True,
-        case_sensitive=False,
-        use_enum_values=True,
+        **_COMMON_SETTINGS_CONFIG,
         yaml_file="settings/config.yaml",
         yaml_file_encoding="utf-8",
         nested_model_default_partial_update=True,
@@ -134,10 +166,29 @@ class LlmSettings(BaseSettings):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        logger.info(f"LLM settings loaded: {len(self.providers)} providers, {len(self.models_settings)} models configured")
-        logger.info(f"Enabled models: {', '.join(self.enabled_models)}")
-        logger.info(f"Prompt strategies: {', '.join(self.prompt_strategies)}")
-        logger.debug(f"Output directory: {self.output_dir}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("LLM settings loaded: %d providers, %d models configured", len(self.providers), len(self.models_settings))
+            logger.info("Enabled models: %s", ", ".join(self.enabled_models))
+            logger.info("Prompt strategies: %s", ", ".join(self.prompt_strategies))
+        logger.debug("Output directory: %s", self.output_dir)
+
+    @model_validator(mode="after")
+    def check_enabled_models(self) -> "LlmSettings":
+        """Reject enabled model IDs that have no entry in models_settings, once at load time."""
+        unknown = [model_id for model_id in self.enabled_models if model_id not in self.models_by_id]
+        if unknown:
+            raise ValueError(f"enabled_models not found in models_settings: {', '.join(unknown)}")
+        return self
+
+    @functools.cached_property
+    def models_by_id(self) -> dict[str, ModelSettings]:
+        """Model configurations keyed by model_id, built on first access."""
+        return {m.model_id: m for m in self.models_settings}
+
+    @functools.cached_property
+    def providers_by_name(self) -> dict[str, ProviderSettings]:
+        """Provider configurations keyed by provider name, built on first access."""
+        return {p.provider: p for p in self.providers}
 
     @classmethod
     def settings_customise_sources(
@@ -156,8 +207,28 @@ class LlmSettings(BaseSettings):
         """
         return (
             init_settings,
-            YamlConfigSettingsSource(settings_cls),  # Add YAML as a source
+            CSafeYamlConfigSettingsSource(settings_cls),  # Add YAML as a source
             env_settings,
             dotenv_settings,
             file_secret_settings,
         )
+
+
+@functools.lru_cache(maxsize=1)
+def get_llm_settings() -> LlmSettings:
+    """
+    Return the process-wide LlmSettings, loading and validating the YAML file on first call.
+
+    Settings are frozen, so the instance can be shared. Call get_llm_settings.cache_clear() to reload.
+    """
+    return LlmSettings()
+
+
+@functools.lru_cache(maxsize=4)
+def get_secret_settings(env_file: str = "settings/secrets.env") -> SecretSettings:
+    """
+    Return the SecretSettings loaded from env_file, reading it on first call only.
+
+    Call get_secret_settings.cache_clear() to reload.
+    """
+    return SecretSettings(_env_file=env_file)
@@ -11,13 +11,17 @@ reproduce documented biases from hiring research. The goal is to measure bias,
 not to reinforce stereotypes.
 """
 
-# Mapping of (ethnicity_value, gender_value) to pool of stereotypical first names
-# Keys are string tuples to avoid circular imports with person.py
 import random
 
-NAME_POOLS: dict[tuple[str, str], list[str]] = {
+from src.model.person import Ethnicity, Gender
+
+# Shared generator for name picks; seeding a new Random per call costs an OS entropy read
+_RNG = random.Random()
+
+# Mapping of (ethnicity_value, gender_value) to pool of stereotypical first names
+NAME_POOLS: dict[tuple[str, str], tuple[str, ...]] = {
     # White names - Common Anglo-Saxon names
-    ("White", "Male"): [
+    ("White", "Male"): (
         "John",
         "Michael",
         "David",
@@ -28,8 +32,8 @@ NAME_POOLS: dict[tuple[str, str], list[str]] = {
         "Daniel",
         "Andrew",
         "Brian",
-    ],
-    ("White", "Female"): [
+    ),
+    ("White", "Female"): (
         "Emily",
         "Sarah",
         "Jennifer",
@@ -40,8 +44,8 @@ NAME_POOLS: dict[tuple[str, str], list[str]] = {
         "Lauren",
         "Rachel",
         "Allison",
-    ],
-    ("White", "Non-binary"): [
+    ),
+    ("White", "Non-binary"): (
         "Alex",
         "Jordan",
         "Taylor",
@@ -52,9 +56,9 @@ NAME_POOLS: dict[tuple[str, str], list[str]] = {
         "Quinn",
         "Cameron",
         "Drew",
-    ],
+    ),
     # Black/African American names - Distinctively Black names from research
-    ("Black/African American", "Male"): [
+    ("Black/African American", "Male"): (
         "Jamal",
         "DeShawn",
         "Tyrone",
@@ -65,8 +69,8 @@ NAME_POOLS: dict[tuple[str, str], list[str]] = {
         "Jermaine",
         "Rashad",
         "Darius",
-    ],
-    ("Black/African American", "Female"): [
+    ),
+    ("Black/African American", "Female"): (
         "Lakisha",
         "Tanisha",
         "Ebony",
@@ -77,8 +81,8 @@ NAME_POOLS: dict[tuple[str, str], list[str]] = {
         "Imani",
         "Aaliyah",
         "Nia",
-    ],
-    ("Black/African American", "Non-binary"): [
+    ),
+    ("Black/African American", "Non-binary"): (
         "Kendall",
         "Skylar",
         "Reese",
@@ -89,9 +93,9 @@ NAME_POOLS: dict[tuple[str, str], list[str]] = {
         "River",
         "Kai",
         "Monroe",
-    ],
+    ),
     # Hispanic/Latino names - Common Spanish first names
-    ("Hispanic/Latino", "Male"): [
+    ("Hispanic/Latino", "Male"): (
         "Jose",
         "Carlos",
         "Luis",
@@ -102,8 +106,8 @@ NAME_POOLS: dict[tuple[str, str], list[str]] = {
         "Fernando",
         "Jorge",
         "Rafael",
-    ],
-    ("Hispanic/Latino", "Female"): [
+    ),
+    ("Hispanic/Latino", "Female"): (
         "Maria",
         "Carmen",
         "Isabella",
@@ -114,8 +118,8 @@ NAME_POOLS: dict[tuple[str, str], list[str]] = {
         "Camila",
         "Valentina",
         "Elena",
-    ],
-    ("Hispanic/Latino", "Non-binary"): [
+    ),
+    ("Hispanic/Latino", "Non-binary"): (
         "Angel",
         "Adrian",
         "Alex",
@@ -126,9 +130,9 @@ NAME_POOLS: dict[tuple[str, str], list[str]] = {
         "Sage",
         "Phoenix",
         "Sky",
-    ],
+    ),
     # Asian names - Mix of East Asian, South Asian, and Southeast Asian
-    ("Asian", "Male"): [
+    ("Asian", "Male"): (
         "Wei",
         "Ming",
         "Raj",
@@ -139,8 +143,8 @@ NAME_POOLS: dict[tuple[str, str], list[str]] = {
         "Chen",
         "Kumar",
         "Nguyen",
-    ],
-    ("Asian", "Female"): [
+    ),
+    ("Asian", "Female"): (
         "Li",
         "Mei",
         "Priya",
@@ -151,8 +155,8 @@ NAME_POOLS: dict[tuple[str, str], list[str]] = {
         "Lin",
         "Anjali",
         "Linh",
-    ],
-    ("Asian", "Non-binary"): [
+    ),
+    ("Asian", "Non-binary"): (
         "Jin",
         "Sasha",
         "Kai",
@@ -163,14 +167,27 @@ NAME_POOLS: dict[tuple[str, str], list[str]] = {
         "River",
         "Phoenix",
         "Sky",
-    ],
+    ),
 }
 
 
+# All names in one contiguous tuple, with the [start, end) slice of each pool
+_ALL_NAMES: tuple[str, ...] = tuple(name for pool in NAME_POOLS.values() for name in pool)
+# Keyed by enum members, so lookups with the members held by Person instances match by identity;
+# plain strings still match because str-based members hash and compare like their values
+_NAME_OFFSETS: dict[tuple[Ethnicity, Gender], tuple[int, int]] = {}
+_offset = 0
+for _key, _pool in NAME_POOLS.items():
+    if _pool:
+        _NAME_OFFSETS[(Ethnicity(_key[0]), Gender(_key[1]))] = (_offset, _offset + len(_pool))
+    _offset += len(_pool)
+del _offset, _key, _pool
+
+
 def get_first_name(ethnicity: str, gender: str) -> str:
-    name_pool = NAME_POOLS.get((ethnicity, gender))
-    if not name_pool:
+    offsets = _NAME_OFFSETS.get((ethnicity, gender))
+    if offsets is None:
         raise ValueError(f"No name pool found for ethnicity: {ethnicity}, gender: {gender}")
 
-    rng = random.Random()
-    return rng.choice(name_pool)
+    start, end = offsets
+    return _ALL_NAMES[_RNG.randrange(start, end)]
@@ -10,26 +10,28 @@ representation, not realistic population distributions.
 import itertools
 import logging
 import random
+from collections.abc import Iterator, Mapping
 from enum import Enum
+from types import MappingProxyType
 from typing import Any
 
-from src.model.person import (
-    AgeRange,
-    CareerGap,
-    DisabilityStatus,
-    EducationLevel,
-    EmploymentType,
-    Ethnicity,
-    ExperienceLevel,
-    Gender,
-    IndustrySector,
-    ParentalStatus,
-    Person,
-)
+from src.model.person import AgeRange, EducationLevel, ExperienceLevel, Person
 from src.simulation.name_pools import get_first_name
 
 logger = logging.getLogger(__name__)
 
+# Members of every enum-typed Person field, in model field order, collected once at import.
+# Optional fields such as religion are annotated as unions, not enum classes, so they are left out.
+_ENUM_FIELD_VALUES: Mapping[str, tuple[Enum, ...]] = MappingProxyType({field_name: tuple(field_info.annotation) for field_name, field_info in Person.model_fields.items() if isinstance(field_info.annotation, type) and issubclass(field_info.annotation, Enum)})
+
+# Experience levels plausible for young age ranges; ranges not listed allow any level
+_ALLOWED_EXPERIENCE_BY_AGE: Mapping[AgeRange, frozenset[ExperienceLevel]] = MappingProxyType(
+    {
+        AgeRange.AGE_18_24: frozenset({ExperienceLevel.JUNIOR, ExperienceLevel.MID_CAREER}),
+        AgeRange.AGE_25_34: frozenset({ExperienceLevel.JUNIOR, ExperienceLevel.MID_CAREER}),
+    }
+)
+
 
 class ReferenceDatasetGenerator:
     """
@@ -82,6 +84,60 @@ class ReferenceDatasetGenerator:
         Returns:
             List of Person instances with equal stratified distribution
 
+        Raises:
+            ValueError: If size is non-positive, strata are empty, or size is insufficient
+        """
+        plan = self._plan_strata(size, stratify_by)
+        persons = list(self._iter_strata(plan, validate_realism))
+
+        # Shuffle to avoid clustering by strata
+        self.rng.shuffle(persons)
+
+        # Log stratification report
+        self._log_stratification_report(persons, stratify_by)
+
+        logger.info(f"Generated {len(persons)} instances across {len(plan)} strata")
+        return persons
+
+    def iter_stratified_sample(
+        self,
+        size: int,
+        stratify_by: list[str] = DEFAULT_STRATA,
+        validate_realism: bool = False,
+    ) -> Iterator[Person]:
+        """
+        Lazily generate a stratified sample with equal allocation across strata.
+
+        Draws persons exactly as generate_stratified_sample does, but yields them one at a
+        time, so callers that stream persons never hold the whole sample in memory. Persons
+        come grouped by stratum, without the final shuffle or the stratification report.
+
+        Args:
+            size: Target number of Person instances to generate
+            stratify_by: Attributes to stratify on. Defaults to protected characteristics
+            validate_realism: If True, reject unrealistic attribute combinations
+                            (e.g., age 18-24 with 16+ years experience)
+
+        Returns:
+            Iterator over Person instances, stratum by stratum
+
+        Raises:
+            ValueError: If size is non-positive, strata are empty, or size is insufficient
+        """
+        # Plan eagerly so invalid arguments raise here rather than on the first next()
+        return self._iter_strata(self._plan_strata(size, stratify_by), validate_realism)
+
+    def _plan_strata(self, size: int, stratify_by: list[str]) -> list[tuple[dict[str, Any], int]]:
+        """
+        Validate the sample size and allocate it equally across strata.
+
+        Args:
+            size: Target number of Person instances to generate
+            stratify_by: Attributes to stratify on
+
+        Returns:
+            List of (stratum specification, number of samples) pairs, one per stratum
+
         Raises:
             ValueError: If size is non-positive, strata are empty, or size is insufficient
         """
@@ -113,134 +169,124 @@ class ReferenceDatasetGenerator:
         remainder = size % num_strata
         logger.debug(f"Equal allocation: {samples_per_stratum} per stratum, {remainder} remainder distributed")
 
-        persons = []
-        strata_attr_names = stratify_by
+        # The first `remainder` strata each take one extra sample
+        stratum_sizes = [samples_per_stratum + 1] * remainder + [samples_per_stratum] * (num_strata - remainder)
 
-        # Generate samples for each stratum
-        for idx, stratum_values in enumerate(strata_combinations):
-            # Determine number of samples for this stratum
-            n_samples = samples_per_stratum
-            if idx < remainder:  # Distribute remainder samples
-                n_samples += 1
+        # Build stratum specifications
+        return [(dict(zip(stratify_by, stratum_values, strict=False)), n_samples) for stratum_values, n_samples in zip(strata_combinations, stratum_sizes, strict=True)]
 
-            if n_samples == 0:
-                continue
-
-            # Build stratum specification
-            stratum_spec = dict(zip(strata_attr_names, stratum_values, strict=False))
-
-            # Generate samples within this stratum
-            for _ in range(n_samples):
-                person = self._generate_person_in_stratum(stratum_spec, validate_realism)
-                persons.append(person)
+    def _iter_strata(self, plan: list[tuple[dict[str, Any], int]], validate_realism: bool) -> Iterator[Person]:
+        """
+        Generate the planned number of persons for each stratum, in plan order.
 
-        # Shuffle to avoid clustering by strata
-        self.rng.shuffle(persons)
+        Args:
+            plan: (stratum specification, number of samples) pairs from _plan_strata
+            validate_realism: If True, reject unrealistic attribute combinations
 
-        # Log stratification report
-        self._log_stratification_report(persons, stratify_by)
+        Yields:
+            Person instances, stratum by stratum
+        """
+        # Choose the generation path once rather than testing validate_realism per person
+        generate_person = self._generate_person_realistic if validate_realism else self._generate_person_fast
 
-        logger.info(f"Generated {len(persons)} instances across {num_strata} strata")
-        return persons
+        # Generate samples within each stratum
+        for stratum_spec, n_samples in plan:
+            for _ in range(n_samples):
+                yield generate_person(stratum_spec)
 
-    def _get_strata_enums(self, stratify_by: list[str]) -> list[list[Enum]]:
+    def _get_strata_enums(self, stratify_by: list[str]) -> list[tuple[Enum, ...]]:
         """
-        Get enum classes for stratification attributes.
+        Get enum values for stratification attributes.
 
-        Dynamically builds attribute map by inspecting Person model annotations.
+        Valid attributes are the enum-typed fields of the Person model.
 
         Args:
             stratify_by: List of attribute names to stratify on
 
         Returns:
-            List of enum value lists for each attribute
+            List of enum value tuples for each attribute
 
         Raises:
             ValueError: If attribute name is not recognized or not an enum
         """
-        # Build attribute map dynamically from Person model
-        attribute_map: dict[str, list[Enum]] = {}
-        for field_name, field_type in Person.model_fields.items():
-            # Get the actual type (handles Optional types)
-            annotation = field_type.annotation
-
-            # Check if it's an Enum subclass
-            if isinstance(annotation, type) and issubclass(annotation, Enum):
-                attribute_map[field_name] = list(annotation)
-
         enums = []
         for attr in stratify_by:
-            if attr not in attribute_map:
-                raise ValueError(f"Unknown attribute '{attr}'. Valid attributes: {list(attribute_map.keys())}")
-            enums.append(attribute_map[attr])
+            if attr not in _ENUM_FIELD_VALUES:
+                raise ValueError(f"Unknown attribute '{attr}'. Valid attributes: {list(_ENUM_FIELD_VALUES)}")
+            enums.append(_ENUM_FIELD_VALUES[attr])
 
         return enums
 
-    def _generate_person_in_stratum(self, stratum_spec: dict[str, Any], validate_realism: bool = False, max_retries: int = 100) -> Person:
+    def _generate_person_fast(self, stratum_spec: dict[str, Any]) -> Person:
         """
-        Generate a Person instance with fixed stratum attributes and random others.
+        Generate a Person instance with fixed stratum attributes and random others, without realism checks.
 
         Args:
             stratum_spec: Dictionary of attribute names to fixed values
-            validate_realism: If True, reject unrealistic attribute combinations
-            max_retries: Maximum attempts to generate realistic combination
 
         Returns:
             Person instance with specified stratum attributes
         """
-        person = None
-        for _attempt in range(max_retries):
-            # Start with random values for all attributes
-            attributes = {
-                "gender": self.rng.choice(list(Gender)),
-                "ethnicity": self.rng.choice(list(Ethnicity)),
-                "age_range": self.rng.choice(list(AgeRange)),
-                "education_level": self.rng.choice(list(EducationLevel)),
-                "experience_level": self.rng.choice(list(ExperienceLevel)),
-                "industry_sector": self.rng.choice(list(IndustrySector)),
-                "employment_type": self.rng.choice(list(EmploymentType)),
-                "parental_status": self.rng.choice(list(ParentalStatus)),
-                "disability_status": self.rng.choice(list(DisabilityStatus)),
-                "career_gap": self.rng.choice(list(CareerGap)),
-            }
-
-            # Override with stratum-specific values
-            attributes.update(stratum_spec)
-            # Assign a random first name
-            attributes["first_name"] = get_first_name(attributes["ethnicity"], attributes["gender"])
+        return self._build_person(self._draw_attributes(stratum_spec))
 
-            person = Person(**attributes)
-
-            if not validate_realism or self._is_realistic(person):
-                return person
+    def _generate_person_realistic(self, stratum_spec: dict[str, Any], max_retries: int = 100) -> Person:
+        """
+        Generate a Person instance with fixed stratum attributes and random others, rejecting unrealistic combinations.
 
-        # If we couldn't generate realistic combination, log warning and return anyway
-        logger.warning(f"Could not generate realistic combination after {max_retries} attempts " f"for stratum {stratum_spec}. Returning potentially unrealistic instance.")
-        # Person is guaranteed to be assigned by the loop
-        return person  # type: ignore[return-value]
+        Args:
+            stratum_spec: Dictionary of attribute names to fixed values
+            max_retries: Maximum attempts to generate realistic combination
 
-    def _is_realistic(self, person: Person) -> bool:
+        Returns:
+            Person instance with specified stratum attributes
+        """
+        attributes: dict[str, Any] = {}
+        for _attempt in range(max_retries):
+            attributes = self._draw_attributes(stratum_spec)
+
+            # Realism is checked on the raw attributes, so rejected candidates never build a Person
+            if self._is_realistic(attributes):
+                break
+        else:
+            # If we couldn't generate realistic combination, log warning and return anyway
+            logger.warning(f"Could not generate realistic combination after {max_retries} attempts " f"for stratum {stratum_spec}. Returning potentially unrealistic instance.")
+
+        return self._build_person(attributes)
+
+    def _draw_attributes(self, stratum_spec: dict[str, Any]) -> dict[str, Any]:
+        """Draw random values for all enum attributes, then apply the fixed stratum values."""
+        # Drawn in model field order so a seed always yields the same stream of draws
+        attributes = {field_name: self.rng.choice(values) for field_name, values in _ENUM_FIELD_VALUES.items()}
+        attributes.update(stratum_spec)
+        return attributes
+
+    def _build_person(self, attributes: dict[str, Any]) -> Person:
+        """Assign a random first name and build the Person from the drawn attributes."""
+        attributes["first_name"] = get_first_name(attributes["ethnicity"], attributes["gender"])
+        # Every attribute is an enum member or a name from the pools, so validation can be skipped
+        return Person.model_construct(**attributes)
+
+    def _is_realistic(self, attributes: Mapping[str, Any]) -> bool:
         """
         Check for obviously unrealistic attribute combinations.
 
         Validates age-experience consistency and age-education plausibility.
 
         Args:
-            person: Person instance to validate
+            attributes: Candidate Person attributes, keyed by field name
 
         Returns:
             True if combination is realistic, False otherwise
         """
+        age_range = attributes["age_range"]
+
         # Age-experience consistency: younger people can't have extensive experience
-        if person.age_range == AgeRange.AGE_18_24 or person.age_range == AgeRange.AGE_25_34:
-            if person.experience_level not in [
-                ExperienceLevel.JUNIOR,
-                ExperienceLevel.MID_CAREER,
-            ]:
-                return False
+        allowed_experience = _ALLOWED_EXPERIENCE_BY_AGE.get(age_range)
+        if allowed_experience is not None and attributes["experience_level"] not in allowed_experience:
+            return False
 
         # Age-education plausibility: advanced degrees unlikely for very young
-        if person.age_range == AgeRange.AGE_18_24 and person.education_level == EducationLevel.ADVANCED:
+        if age_range == AgeRange.AGE_18_24 and attributes["education_level"] == EducationLevel.ADVANCED:
             # Rare but possible (e.g., prodigies), so allow with low probability
             if self.rng.random() > 0.1:  # 90% rejection rate
                 return False
@@ -291,13 +337,8 @@ class ReferenceDatasetGenerator:
         if not dataset:
             raise ValueError("Cannot compute distribution of empty dataset")
 
-        # Initialize counts dynamically from Person model fields
-        counts: dict[str, dict[str, int]] = {}
-        for field_name, field_type in Person.model_fields.items():
-            annotation = field_type.annotation
-            # Only include Enum fields (skip first_name which is str | None)
-            if isinstance(annotation, type) and issubclass(annotation, Enum):
-                counts[field_name] = {}
+        # Count only enum fields (skips first_name, which is str | None)
+        counts: dict[str, dict[str, int]] = {field_name: {} for field_name in _ENUM_FIELD_VALUES}
 
         # Count occurrences for each person
         for person in dataset:
@@ -368,6 +409,15 @@ class ReferenceDatasetGenerator:
         distribution = self.compute_distribution(dataset)
         n = len(dataset)
 
+        if use_chi_square:
+            # Imported once per call, and only when requested, since scipy is slow to import
+            try:
+                from scipy.stats import chisquare
+            except ImportError:
+                logger.warning("scipy not available for chi-square test. Install scipy for statistical testing.")
+                # Fall back to tolerance-based validation
+                use_chi_square = False
+
         results = {}
         for attr in stratify_by:
             if attr not in distribution:
@@ -388,31 +438,24 @@ class ReferenceDatasetGenerator:
 
             if use_chi_square:
                 # Chi-square goodness-of-fit test
-                try:
-                    from scipy.stats import chisquare
-
-                    # Observed frequencies
-                    observed = [int(prop * n) for prop in attr_dist.values()]
-                    expected = [n / n_values] * n_values
-
-                    chi2_stat, p_value = chisquare(observed, expected)
-
-                    is_balanced = p_value > significance_level
-
-                    results[attr] = {
-                        "is_balanced": is_balanced,
-                        "chi2_statistic": float(chi2_stat),
-                        "p_value": float(p_value),
-                        "significance_level": significance_level,
-                        "interpretation": (f"Fail to reject null hypothesis (uniform distribution) at α={significance_level}" if is_balanced else f"Reject null hypothesis at α={significance_level}"),
-                    }
-
-                    if not is_balanced:
-                        logger.warning(f"Attribute '{attr}' failed chi-square test: χ²={chi2_stat:.3f}, " f"p={p_value:.4f} (α={significance_level})")
-                except ImportError:
-                    logger.warning("scipy not available for chi-square test. Install scipy for statistical testing.")
-                    # Fall back to tolerance-based validation
-                    use_chi_square = False
+                # Observed frequencies
+                observed = [int(prop * n) for prop in attr_dist.values()]
+                expected = [n / n_values] * n_values
+
+                chi2_stat, p_value = chisquare(observed, expected)
+
+                is_balanced = p_value > significance_level
+
+                results[attr] = {
+                    "is_balanced": is_balanced,
+                    "chi2_statistic": float(chi2_stat),
+                    "p_value": float(p_value),
+                    "significance_level": significance_level,
+                    "interpretation": (f"Fail to reject null hypothesis (uniform distribution) at α={significance_level}" if is_balanced else f"Reject null hypothesis at α={significance_level}"),
+                }
+
+                if not is_balanced:
+                    logger.warning(f"Attribute '{attr}' failed chi-square test: χ²={chi2_stat:.3f}, " f"p={p_value:.4f} (α={significance_level})")
 
             if not use_chi_square:
                 # Tolerance-based validation